@@ -9,10 +9,19 @@ from company_scrapers import (
     GoogleCareersScraper, AmazonCareersScraper, AppleCareersScraper,
     MicrosoftCareersScraper, MetaCareersScraper, TeslaCareersScraper
 )
-from models import DatabaseManager
+from models import DatabaseManager, Job
 from location_filter import is_us_location, filter_us_jobs
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
 import time
+import json
+
+
+def _tags_json(tags):
+    """Tags as the JSON text exports have always used; legacy string values pass through"""
+    if tags is None or isinstance(tags, str):
+        return tags
+    return json.dumps(tags)
 
 
 class JobAggregator:
@@ -91,56 +100,77 @@ class JobAggregator:
         print(f"Location: {location or 'All'}")
         print(f"{'='*60}\n")
 
-        for source_name, scraper in active_scrapers.items():
-            print(f"Scraping {source_name}...", end=' ')
+        def timed_scrape(scraper):
             start_time = time.time()
-
-            try:
-                jobs = scraper.scrape(keywords=keywords, location=location, max_pages=max_pages)
-
-                # Filter for US jobs if enabled
-                filtered_count = 0
-                if self.us_only:
-                    before_filter = len(jobs)
-                    jobs = filter_us_jobs(jobs)
-                    filtered_count = before_filter - len(jobs)
-
-                scraped_count = len(jobs)
-                new_count = 0
-                duplicate_count = 0
-
-                for job in jobs:
-                    is_new, _ = self.db.add_job(job)
-                    if is_new:
-                        new_count += 1
+            jobs = scraper.scrape(keywords=keywords, location=location, max_pages=max_pages)
+            return jobs, time.time() - start_time
+
+        # Job IDs already handled this run; sources overlap heavily (RemoteOK,
+        # Remotive, WWR), so repeats are counted as duplicates without a DB round trip
+        seen = set()
+
+        # Scrape all sources concurrently so each source's rate-limit waits overlap
+        # the other sources' network I/O; results are stored in source order
+        with ThreadPoolExecutor(max_workers=max(len(active_scrapers), 1)) as executor:
+            futures = {
+                source_name: executor.submit(timed_scrape, scraper)
+                for source_name, scraper in active_scrapers.items()
+            }
+
+            for source_name, future in futures.items():
+                print(f"Scraping {source_name}...", end=' ')
+
+                try:
+                    jobs, scrape_elapsed = future.result()
+                    start_time = time.time()
+
+                    # Filter for US jobs if enabled
+                    filtered_count = 0
+                    if self.us_only:
+                        before_filter = len(jobs)
+                        jobs = filter_us_jobs(jobs)
+                        filtered_count = before_filter - len(jobs)
+
+                    scraped_count = len(jobs)
+                    new_count = 0
+                    duplicate_count = 0
+
+                    for job in jobs:
+                        job_id = Job.generate_job_id(job['title'], job['company'], job.get('location', 'N/A'))
+                        if job_id in seen:
+                            duplicate_count += 1
+                            continue
+                        seen.add(job_id)
+
+                        is_new, _ = self.db.add_job(job)
+                        if is_new:
+                            new_count += 1
+                        else:
+                            duplicate_count += 1
+
+                    elapsed = scrape_elapsed + time.time() - start_time
+                    if filtered_count > 0:
+                        print(f"[OK] ({scraped_count} US jobs, {new_count} new, {duplicate_count} duplicates, {filtered_count} non-US filtered) - {elapsed:.1f}s")
                     else:
-                        duplicate_count += 1
-
-                elapsed = time.time() - start_time
-                if filtered_count > 0:
-                    print(f"[OK] ({scraped_count} US jobs, {new_count} new, {duplicate_count} duplicates, {filtered_count} non-US filtered) - {elapsed:.1f}s")
-                else:
-                    print(f"[OK] ({scraped_count} found, {new_count} new, {duplicate_count} duplicates) - {elapsed:.1f}s")
-
-                stats['total_scraped'] += scraped_count
-                stats['total_new'] += new_count
-                stats['total_duplicates'] += duplicate_count
-                stats['by_source'][source_name] = {
-                    'scraped': scraped_count,
-                    'new': new_count,
-                    'duplicates': duplicate_count
-                }
-
-                time.sleep(1)  # Be respectful between sources
-
-            except Exception as e:
-                print(f"[FAIL] Error: {e}")
-                stats['by_source'][source_name] = {
-                    'scraped': 0,
-                    'new': 0,
-                    'duplicates': 0,
-                    'error': str(e)
-                }
+                        print(f"[OK] ({scraped_count} found, {new_count} new, {duplicate_count} duplicates) - {elapsed:.1f}s")
+
+                    stats['total_scraped'] += scraped_count
+                    stats['total_new'] += new_count
+                    stats['total_duplicates'] += duplicate_count
+                    stats['by_source'][source_name] = {
+                        'scraped': scraped_count,
+                        'new': new_count,
+                        'duplicates': duplicate_count
+                    }
+
+                except Exception as e:
+                    print(f"[FAIL] Error: {e}")
+                    stats['by_source'][source_name] = {
+                        'scraped': 0,
+                        'new': 0,
+                        'duplicates': 0,
+                        'error': str(e)
+                    }
 
         print(f"\n{'='*60}")
         print(f"Aggregation Complete!")
@@ -153,6 +183,15 @@ class JobAggregator:
 
     def search_jobs(self, keyword=None, source=None, remote=None, limit=100):
         """Search stored jobs"""
+        return self.db.get_jobs(filters=self._search_filters(keyword, source, remote), limit=limit)
+
+    def search_jobs_iter(self, keyword=None, source=None, remote=None, limit=100):
+        """Search stored jobs, streaming results instead of loading them all at once"""
+        return self.db.iter_jobs(filters=self._search_filters(keyword, source, remote), limit=limit)
+
+    @staticmethod
+    def _search_filters(keyword=None, source=None, remote=None):
+        """Build the DatabaseManager filters dict for a search"""
         filters = {}
         if source:
             filters['source'] = source
@@ -160,8 +199,7 @@ class JobAggregator:
             filters['remote'] = remote
         if keyword:
             filters['keyword'] = keyword
-
-        return self.db.get_jobs(filters=filters, limit=limit)
+        return filters
 
     def export_jobs(self, filename, format='csv', filters=None):
         """Export jobs to CSV or JSON"""
@@ -185,7 +223,7 @@ class JobAggregator:
                 'Posted Date': job.posted_date,
                 'Job Type': job.job_type,
                 'Salary': job.salary,
-                'Tags': job.tags,
+                'Tags': _tags_json(job.tags),
                 'Remote': job.remote,
                 'Created At': job.created_at
             })
@@ -201,22 +239,7 @@ class JobAggregator:
 
     def get_statistics(self):
         """Get database statistics"""
-        from sqlalchemy import func
-        from models import Job
-
-        total = self.db.session.query(Job).count()
-
-        by_source = {}
-        for source, count in self.db.session.query(Job.source, func.count(Job.id)).group_by(Job.source).all():
-            by_source[source] = count
-
-        remote_count = self.db.session.query(Job).filter_by(remote=True).count()
-
-        return {
-            'total_jobs': total,
-            'remote_jobs': remote_count,
-            'by_source': by_source
-        }
+        return self.db.get_stats()
 
     def close(self):
         """Close database connection"""
@@ -19,13 +19,12 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
-import json
 import time
 from typing import List, Dict
 import re
 import xml.etree.ElementTree as ET
 import sys
-from scrapers import BaseScraper
+from scrapers import BaseScraper, ScrapedJob
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
@@ -97,19 +96,19 @@ class GoogleCareersScraper(BaseScraper):
                     # Clean HTML from description
                     clean_desc = BeautifulSoup(description, 'html.parser').get_text()[:500] if description else ''
 
-                    jobs.append({
-                        'title': title,
-                        'company': employer,
-                        'location': location_str,
-                        'description': clean_desc,
-                        'url': job_url,
-                        'source': 'google_careers',
-                        'posted_date': self.normalize_date(published),
-                        'job_type': 'Full-time' if job_type == 'FULL_TIME' else job_type,
-                        'salary': None,  # Google doesn't include salary in feed
-                        'tags': json.dumps(['tech', 'google', 'faang']),
-                        'remote': is_remote.lower() == 'yes'
-                    })
+                    jobs.append(ScrapedJob(
+                        title=title,
+                        company=employer,
+                        location=location_str,
+                        description=clean_desc,
+                        url=job_url,
+                        source='google_careers',
+                        posted_date=self.normalize_date(published),
+                        job_type='Full-time' if job_type == 'FULL_TIME' else job_type,
+                        salary=None,  # Google doesn't include salary in feed
+                        tags=['tech', 'google', 'faang'],
+                        remote=is_remote.lower() == 'yes'
+                    ))
 
                     count += 1
 
@@ -173,19 +172,19 @@ class AppleCareersScraper(BaseScraper):
                         if keywords and keywords.lower() not in title.lower() and keywords.lower() not in team.lower():
                             continue
 
-                        jobs.append({
-                            'title': title,
-                            'company': 'Apple',
-                            'location': location_str,
-                            'description': f"{team} - {title}",
-                            'url': f"https://jobs.apple.com/en-us/details/{job_id}",
-                            'source': 'apple_careers',
-                            'posted_date': self.normalize_date(posting_date),
-                            'job_type': 'Full-time',
-                            'salary': None,
-                            'tags': json.dumps(['tech', 'apple', 'faang']),
-                            'remote': 'remote' in title.lower() or 'remote' in location_str.lower()
-                        })
+                        jobs.append(ScrapedJob(
+                            title=title,
+                            company='Apple',
+                            location=location_str,
+                            description=f"{team} - {title}",
+                            url=f"https://jobs.apple.com/en-us/details/{job_id}",
+                            source='apple_careers',
+                            posted_date=self.normalize_date(posting_date),
+                            job_type='Full-time',
+                            salary=None,
+                            tags=['tech', 'apple', 'faang'],
+                            remote='remote' in title.lower() or 'remote' in location_str.lower()
+                        ))
 
                     except Exception as e:
                         print(f"Error parsing Apple job: {e}")
@@ -244,19 +243,19 @@ class MicrosoftCareersScraper(BaseScraper):
                         description = job.get('description', '')
                         posted_date = job.get('postingDate', '')
 
-                        jobs.append({
-                            'title': title,
-                            'company': 'Microsoft',
-                            'location': location_str,
-                            'description': description[:500] if description else '',
-                            'url': f"https://careers.microsoft.com/us/en/job/{job_id}",
-                            'source': 'microsoft_careers',
-                            'posted_date': self.normalize_date(posted_date),
-                            'job_type': 'Full-time',
-                            'salary': None,
-                            'tags': json.dumps(['tech', 'microsoft', 'faang']),
-                            'remote': 'remote' in title.lower() or 'remote' in location_str.lower()
-                        })
+                        jobs.append(ScrapedJob(
+                            title=title,
+                            company='Microsoft',
+                            location=location_str,
+                            description=description[:500] if description else '',
+                            url=f"https://careers.microsoft.com/us/en/job/{job_id}",
+                            source='microsoft_careers',
+                            posted_date=self.normalize_date(posted_date),
+                            job_type='Full-time',
+                            salary=None,
+                            tags=['tech', 'microsoft', 'faang'],
+                            remote='remote' in title.lower() or 'remote' in location_str.lower()
+                        ))
 
                     except Exception as e:
                         print(f"Error parsing Microsoft job: {e}")
@@ -322,19 +321,19 @@ class AmazonCareersScraper(BaseScraper):
                         posted_date = job.get('posted_date', '')
                         company_name = job.get('company_name', 'Amazon')
 
-                        jobs.append({
-                            'title': title,
-                            'company': company_name,
-                            'location': location_str,
-                            'description': description[:500] if description else '',
-                            'url': f"https://www.amazon.jobs/en/jobs/{job_id}",
-                            'source': 'amazon_careers',
-                            'posted_date': self.normalize_date(posted_date),
-                            'job_type': 'Full-time',
-                            'salary': None,
-                            'tags': json.dumps(['tech', 'amazon', 'faang']),
-                            'remote': job.get('is_remote', False) or 'remote' in title.lower()
-                        })
+                        jobs.append(ScrapedJob(
+                            title=title,
+                            company=company_name,
+                            location=location_str,
+                            description=description[:500] if description else '',
+                            url=f"https://www.amazon.jobs/en/jobs/{job_id}",
+                            source='amazon_careers',
+                            posted_date=self.normalize_date(posted_date),
+                            job_type='Full-time',
+                            salary=None,
+                            tags=['tech', 'amazon', 'faang'],
+                            remote=job.get('is_remote', False) or 'remote' in title.lower()
+                        ))
 
                     except Exception as e:
                         print(f"Error parsing Amazon job: {e}")
@@ -373,7 +372,7 @@ class MetaCareersScraper(BaseScraper):
             response = self.session.get(base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'html.parser')
 
             # Meta uses a complex React structure - this is a simplified scraper
             # For production, you'd want to use their API if available or Selenium
@@ -390,19 +389,19 @@ class MetaCareersScraper(BaseScraper):
                     location_elem = card.find('div', class_='_9axz')
                     location_str = location_elem.text.strip() if location_elem else 'USA'
 
-                    jobs.append({
-                        'title': title,
-                        'company': 'Meta',
-                        'location': location_str,
-                        'description': '',
-                        'url': job_url,
-                        'source': 'meta_careers',
-                        'posted_date': datetime.utcnow(),
-                        'job_type': 'Full-time',
-                        'salary': None,
-                        'tags': json.dumps(['tech', 'meta', 'facebook', 'faang']),
-                        'remote': 'remote' in title.lower() or 'remote' in location_str.lower()
-                    })
+                    jobs.append(ScrapedJob(
+                        title=title,
+                        company='Meta',
+                        location=location_str,
+                        description='',
+                        url=job_url,
+                        source='meta_careers',
+                        posted_date=datetime.utcnow(),
+                        job_type='Full-time',
+                        salary=None,
+                        tags=['tech', 'meta', 'facebook', 'faang'],
+                        remote='remote' in title.lower() or 'remote' in location_str.lower()
+                    ))
 
                 except Exception as e:
                     print(f"Error parsing Meta job: {e}")
@@ -453,19 +452,19 @@ class TeslaCareersScraper(BaseScraper):
                         if location and location.lower() not in location_str.lower():
                             continue
 
-                        jobs.append({
-                            'title': title,
-                            'company': 'Tesla',
-                            'location': location_str,
-                            'description': description[:500] if description else '',
-                            'url': f"https://www.tesla.com/careers/job/{job_id}",
-                            'source': 'tesla_careers',
-                            'posted_date': datetime.utcnow(),
-                            'job_type': 'Full-time',
-                            'salary': None,
-                            'tags': json.dumps(['tech', 'tesla', 'automotive', 'ev']),
-                            'remote': 'remote' in title.lower() or 'remote' in location_str.lower()
-                        })
+                        jobs.append(ScrapedJob(
+                            title=title,
+                            company='Tesla',
+                            location=location_str,
+                            description=description[:500] if description else '',
+                            url=f"https://www.tesla.com/careers/job/{job_id}",
+                            source='tesla_careers',
+                            posted_date=datetime.utcnow(),
+                            job_type='Full-time',
+                            salary=None,
+                            tags=['tech', 'tesla', 'automotive', 'ev'],
+                            remote='remote' in title.lower() or 'remote' in location_str.lower()
+                        ))
 
                     except Exception as e:
                         print(f"Error parsing Tesla job: {e}")
@@ -6,7 +6,6 @@ Add this to your scrapers.py or use as standalone module.
 """
 
 import requests
-import json
 import time
 from datetime import datetime
 from abc import ABC, abstractmethod
@@ -224,7 +223,7 @@ class IndeedRapidAPIScraper:
                 'posted_date': self._normalize_date(posted),
                 'job_type': str(job_type),
                 'salary': str(salary) if salary else None,
-                'tags': json.dumps(job.get('tags', [])),
+                'tags': job.get('tags') or [],
                 'remote': 'remote' in str(location).lower()
             }
 
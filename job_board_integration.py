@@ -3,7 +3,7 @@ Job Board Integration
 Lightweight database with essential fields only + on-demand detail fetching
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Float
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Float, Index, and_
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.exc import OperationalError, DBAPIError
 from datetime import datetime
@@ -107,6 +107,16 @@ class JobListing(Base):
         }
 
 
+# Partial index over just the listings that have a salary, so the
+# "with salary" count scans that small index instead of the whole table
+_HAS_SALARY = and_(JobListing.salary.isnot(None), JobListing.salary != '')
+ix_job_listings_with_salary = Index(
+    'ix_job_listings_with_salary', JobListing.id,
+    sqlite_where=_HAS_SALARY,
+    postgresql_where=_HAS_SALARY
+)
+
+
 class JobBoardDatabase:
     """Lightweight database manager for job board"""
 
@@ -130,6 +140,8 @@ class JobBoardDatabase:
 
         self.engine = create_engine(database_url, **engine_kwargs)
         Base.metadata.create_all(self.engine)
+        # create_all only adds indexes along with new tables; backfill existing databases
+        ix_job_listings_with_salary.create(self.engine, checkfirst=True)
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
 
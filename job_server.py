@@ -424,7 +424,10 @@ async def run_genz_search(
     # Run search in background
     def run_search():
         searcher = GenZJobSearcher()
-        stats = searcher.run_search_profile(profile_name, max_keywords=max_keywords)
+        try:
+            stats = searcher.run_search_profile(profile_name, max_keywords=max_keywords)
+        finally:
+            searcher.close()
         # Import results to job board
         job_api.import_from_aggregator()
         return stats
@@ -460,7 +463,10 @@ async def run_all_genz_searches(
 
     def run_all_searches():
         searcher = GenZJobSearcher()
-        stats = searcher.run_all_profiles(max_keywords_per_profile=max_keywords_per_profile)
+        try:
+            stats = searcher.run_all_profiles(max_keywords_per_profile=max_keywords_per_profile)
+        finally:
+            searcher.close()
         # Import results to job board
         job_api.import_from_aggregator()
         return stats
@@ -491,7 +497,10 @@ async def run_priority_genz_searches(background_tasks: BackgroundTasks):
 
     def run_priority():
         searcher = GenZJobSearcher()
-        stats = searcher.run_priority_profiles()
+        try:
+            stats = searcher.run_priority_profiles()
+        finally:
+            searcher.close()
         # Import results to job board
         job_api.import_from_aggregator()
         return stats
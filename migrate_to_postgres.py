@@ -14,7 +14,7 @@ import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from models import Base, Job
+from models import Base, Job, upgrade_postgres_tags
 from datetime import datetime
 
 load_dotenv()
@@ -96,6 +96,8 @@ def migrate_sqlite_to_postgres(sqlite_path='sqlite:///job_board.db', batch_size=
 
     try:
         Base.metadata.create_all(postgres_engine)
+        # Existing tables keep their old TEXT tags column until upgraded
+        upgrade_postgres_tags(postgres_engine)
         print("[OK] Tables created successfully")
     except Exception as e:
         print(f"[FAIL] Could not create tables: {e}")
@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean
-from sqlalchemy.orm import declarative_base, sessionmaker
-from datetime import datetime
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, Index, cast, func, inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import declarative_base, sessionmaker, raiseload
 import hashlib
+import json
+import os
 
 Base = declarative_base()
 
@@ -20,9 +23,14 @@ class Job(Base):
     posted_date = Column(DateTime, index=True)
     job_type = Column(String(100))
     salary = Column(String(255))
-    tags = Column(Text)  # JSON string of tags/skills
+    tags = Column(JSON().with_variant(JSONB, 'postgresql'))  # List of tags/skills
     remote = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Filled by the DB, also on bulk inserts: the SQL default is rendered into each
+    # INSERT, so it works on tables created before the column had a DB-side DEFAULT
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+
+    # Fetch server-generated columns on insert so returned jobs are usable after their session closes
+    __mapper_args__ = {'eager_defaults': True}
 
     @staticmethod
     def generate_job_id(title, company, location):
@@ -34,6 +42,36 @@ class Job(Base):
         return f"<Job(title='{self.title}', company='{self.company}', source='{self.source}')>"
 
 
+ix_jobs_created_at = Index('ix_jobs_created_at', Job.created_at)
+
+# GIN index so PostgreSQL can answer tag containment queries (tags @> '["python"]')
+ix_jobs_tags_gin = Index('ix_jobs_tags_gin', Job.tags, postgresql_using='gin').ddl_if(dialect='postgresql')
+
+
+def _parse_tags(tags):
+    """Accept tags as a list or a legacy JSON-encoded string"""
+    if isinstance(tags, str):
+        try:
+            return json.loads(tags)
+        except ValueError:
+            return [tags]
+    return tags
+
+
+def upgrade_postgres_tags(engine):
+    """
+    One-time upgrade of jobs.tags from the old TEXT column to jsonb
+
+    psycopg2 only decodes json/jsonb columns, so a TEXT column would come
+    back as raw strings. Also adds the GIN index missing on existing tables.
+    """
+    columns = {column['name']: column['type'] for column in inspect(engine).get_columns('jobs')}
+    if not isinstance(columns['tags'], JSONB):
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE jobs ALTER COLUMN tags TYPE jsonb USING NULLIF(tags, '')::jsonb"))
+    ix_jobs_tags_gin.create(engine, checkfirst=True)
+
+
 class DatabaseManager:
     def __init__(self, database_url='sqlite:///jobs.db'):
         # Add connection pooling and health checks for PostgreSQL
@@ -44,15 +82,27 @@ class DatabaseManager:
                 'pool_recycle': 3600,   # Recycle connections after 1 hour
                 'pool_size': 5,         # Max 5 connections in pool
                 'max_overflow': 10,     # Allow up to 10 overflow connections
+                'insertmanyvalues_page_size': 1000,  # Rows per multi-VALUES INSERT
                 'connect_args': {
                     'connect_timeout': 10
                 }
             })
+            if make_url(database_url).get_driver_name() == 'psycopg2':
+                # psycopg2-only option: batch UPDATE/DELETE executemany too
+                engine_kwargs['executemany_mode'] = 'values_plus_batch'
+        elif database_url.startswith('sqlite'):
+            # Rows per multi-VALUES INSERT. SQLAlchemy further splits each batch to
+            # the SQLite build's bound parameter limit (999 before 3.32, 32766 after)
+            engine_kwargs['insertmanyvalues_page_size'] = 500
 
         self.engine = create_engine(database_url, **engine_kwargs)
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        # create_all only adds indexes along with new tables; backfill existing databases
+        ix_jobs_created_at.create(self.engine, checkfirst=True)
+        if self.engine.dialect.name == 'postgresql':
+            upgrade_postgres_tags(self.engine)
+        # Short-lived session per operation; objects stay readable after commit
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def add_job(self, job_data):
         """Add a job to the database if it doesn't exist"""
@@ -62,18 +112,76 @@ class DatabaseManager:
             job_data.get('location', 'N/A')
         )
 
-        existing = self.session.query(Job).filter_by(job_id=job_id).first()
-        if existing:
-            return False, existing
+        with self.Session.begin() as session:
+            existing = session.query(Job).filter_by(job_id=job_id).first()
+            if existing:
+                return False, existing
 
-        job = Job(job_id=job_id, **job_data)
-        self.session.add(job)
-        self.session.commit()
+            job = Job(job_id=job_id, **{**job_data, 'tags': _parse_tags(job_data.get('tags'))})
+            session.add(job)
         return True, job
 
+    def add_jobs_bulk(self, jobs_data):
+        """
+        Add a batch of jobs in a single transaction, skipping duplicates
+
+        Returns:
+            Number of new jobs added
+        """
+        new_jobs = {}
+        for job_data in jobs_data:
+            job_id = Job.generate_job_id(
+                job_data['title'],
+                job_data['company'],
+                job_data.get('location', 'N/A')
+            )
+            new_jobs.setdefault(job_id, job_data)
+
+        if not new_jobs:
+            return 0
+
+        with self.Session.begin() as session:
+            existing = session.query(Job.job_id).filter(Job.job_id.in_(list(new_jobs))).all()
+            for (job_id,) in existing:
+                del new_jobs[job_id]
+
+            session.add_all([
+                Job(job_id=job_id, **{**job_data, 'tags': _parse_tags(job_data.get('tags'))})
+                for job_id, job_data in new_jobs.items()
+            ])
+        return len(new_jobs)
+
     def get_jobs(self, filters=None, limit=100):
         """Retrieve jobs with optional filters"""
-        query = self.session.query(Job)
+        with self.Session.begin() as session:
+            return self._jobs_query(session, filters).limit(limit).all()
+
+    def iter_jobs(self, filters=None, limit=100, batch_size=50):
+        """
+        Stream jobs like get_jobs, loading batch_size rows at a time
+
+        The session stays open until the generator is exhausted or closed.
+        """
+        with self.Session.begin() as session:
+            yield from self._jobs_query(session, filters).limit(limit).yield_per(batch_size)
+
+    def get_jobs_strict(self, filters=None, limit=100):
+        """
+        Retrieve jobs like get_jobs, but fail on lazy loads when STRICT_ORM is set
+
+        List endpoints must load relationships explicitly (e.g. selectinload)
+        rather than lazily per row; raiseload('*') turns an accidental N+1
+        into an error during development and tests.
+        """
+        with self.Session.begin() as session:
+            query = self._jobs_query(session, filters)
+            if os.getenv('STRICT_ORM'):
+                query = query.options(raiseload('*'))
+            return query.limit(limit).all()
+
+    def _jobs_query(self, session, filters=None):
+        """Build the filtered, newest-first job query shared by get_jobs*"""
+        query = session.query(Job)
 
         if filters:
             if 'source' in filters:
@@ -85,22 +193,25 @@ class DatabaseManager:
                 query = query.filter(
                     (Job.title.like(keyword)) |
                     (Job.description.like(keyword)) |
-                    (Job.tags.like(keyword))
+                    (cast(Job.tags, Text).like(keyword))
                 )
 
-        return query.order_by(Job.posted_date.desc()).limit(limit).all()
+        return query.order_by(Job.posted_date.desc())
 
     def get_stats(self):
         """Get statistics about scraped jobs"""
-        total = self.session.query(Job).count()
-        by_source = {}
-        for source, count in self.session.query(Job.source, func.count(Job.id)).group_by(Job.source).all():
-            by_source[source] = count
+        with self.Session.begin() as session:
+            total = session.query(Job).count()
+            remote = session.query(Job).filter_by(remote=True).count()
+            by_source = {}
+            for source, count in session.query(Job.source, func.count(Job.id)).group_by(Job.source).all():
+                by_source[source] = count
 
         return {
             'total_jobs': total,
+            'remote_jobs': remote,
             'by_source': by_source
         }
 
     def close(self):
-        self.session.close()
+        self.engine.dispose()
@@ -5,17 +5,24 @@ Respects rate limits for each API source.
 """
 
 import time
+import queue
+import threading
 import schedule
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict
 from aggregator import JobAggregator
 from indeed_rapidapi_scraper import IndeedRapidAPIScraper
+from location_filter import filter_us_jobs
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Queued after the last job to make the DB writer flush and exit
+_STOP_WRITER = object()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -155,6 +162,10 @@ class GenZJobSearcher:
         }
     }
 
+    # DB writer flushes after this many queued jobs or seconds, whichever first
+    WRITE_BATCH_SIZE = 500
+    WRITE_FLUSH_SECONDS = 5
+
     def __init__(self, database_url='sqlite:///job_board.db', us_only=True):
         self.aggregator = JobAggregator(database_url=database_url, us_only=us_only)
         self.indeed_scraper = None
@@ -175,8 +186,62 @@ class GenZJobSearcher:
             'last_run': None
         }
 
+        # Scraped jobs are persisted by a background writer so inserts overlap
+        # with scraping and rate-limit waits
+        self._write_q = queue.Queue()
+        self._written_new = 0
+        self._writer = threading.Thread(target=self._db_writer, name='db-writer', daemon=True)
+        self._writer.start()
+
         print(f"Gen-Z Job Searcher initialized (US only: {us_only})")
 
+    def _db_writer(self):
+        """Consume queued jobs and write them to the database in batches"""
+        batch = []
+        deadline = None
+
+        while True:
+            # Idle: block until the next job (or close()) instead of polling;
+            # otherwise wait at most until the pending batch is due
+            timeout = max(0, deadline - time.monotonic()) if batch else None
+            try:
+                job = self._write_q.get(timeout=timeout)
+            except queue.Empty:
+                job = None
+
+            if job is _STOP_WRITER:
+                self._flush_writes(batch)
+                self._write_q.task_done()
+                return
+
+            if job is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.WRITE_FLUSH_SECONDS
+                batch.append(job)
+
+            if len(batch) >= self.WRITE_BATCH_SIZE or time.monotonic() >= deadline:
+                self._flush_writes(batch)
+                batch = []
+
+    def _flush_writes(self, batch):
+        """Write one batch of queued jobs and mark them done"""
+        if not batch:
+            return
+        try:
+            self._written_new += self.aggregator.db.add_jobs_bulk(batch)
+        except Exception as e:
+            logger.error(f"Error writing {len(batch)} jobs to database: {e}")
+        finally:
+            for _ in batch:
+                self._write_q.task_done()
+
+    def close(self):
+        """Flush pending writes, stop the DB writer thread and close the database"""
+        if self._writer.is_alive():
+            self._write_q.put(_STOP_WRITER)
+            self._writer.join()
+        self.aggregator.close()
+
     def search_with_rate_limit(self, source: str, keyword: str, category: str = None):
         """
         Perform search with rate limiting
@@ -204,22 +269,22 @@ class GenZJobSearcher:
 
                 # Filter for US jobs if enabled
                 if self.us_only:
-                    from location_filter import filter_us_jobs
                     before_filter = len(results)
                     results = filter_us_jobs(results)
                     filtered = before_filter - len(results)
                     if filtered > 0:
                         logger.info(f"Filtered {filtered} non-US jobs from Indeed")
 
-                # Add to database
-                new_count = 0
+                # Hand off to the DB writer; it flushes while we wait out the rate limit
+                written_before = self._written_new
                 for job in results:
-                    is_new, _ = self.aggregator.db.add_job(job)
-                    if is_new:
-                        new_count += 1
+                    self._write_q.put(job)
 
-                logger.info(f"Indeed: Found {len(results)} jobs, {new_count} new")
                 time.sleep(delay)
+                self._write_q.join()
+                new_count = self._written_new - written_before
+
+                logger.info(f"Indeed: Found {len(results)} jobs, {new_count} new")
                 return new_count, len(results)
 
             else:
@@ -243,6 +308,18 @@ class GenZJobSearcher:
             time.sleep(delay)  # Still respect rate limit on errors
             return 0, 0
 
+    def sources_for_profile(self, profile_name: str) -> List[str]:
+        """
+        Sources to search for a profile
+
+        RemoteOK is good for tech jobs, Remotive for all remote positions.
+        Indeed (if available) is best for finance and entry-level roles.
+        """
+        sources = ['remoteok', 'remotive']
+        if self.indeed_scraper and profile_name in ['entry_finance', 'mid_finance', 'entry_marketing']:
+            sources.append('indeed_rapidapi')
+        return sources
+
     def run_search_profile(self, profile_name: str, max_keywords: int = None):
         """
         Run all searches for a specific profile
@@ -276,27 +353,12 @@ class GenZJobSearcher:
         for keyword in keywords:
             stats['keywords_searched'] += 1
 
-            # RemoteOK - Good for tech jobs
-            new, total = self.search_with_rate_limit('remoteok', keyword)
-            stats['new_jobs_added'] += new
-            stats['total_jobs_found'] += total
-            if 'remoteok' not in stats['sources_used']:
-                stats['sources_used'].append('remoteok')
-
-            # Remotive - Good for all remote positions
-            new, total = self.search_with_rate_limit('remotive', keyword)
-            stats['new_jobs_added'] += new
-            stats['total_jobs_found'] += total
-            if 'remotive' not in stats['sources_used']:
-                stats['sources_used'].append('remotive')
-
-            # Indeed (if available) - Best for finance, entry-level
-            if self.indeed_scraper and profile_name in ['entry_finance', 'mid_finance', 'entry_marketing']:
-                new, total = self.search_with_rate_limit('indeed_rapidapi', keyword)
+            for source in self.sources_for_profile(profile_name):
+                new, total = self.search_with_rate_limit(source, keyword)
                 stats['new_jobs_added'] += new
                 stats['total_jobs_found'] += total
-                if 'indeed_rapidapi' not in stats['sources_used']:
-                    stats['sources_used'].append('indeed_rapidapi')
+                if source not in stats['sources_used']:
+                    stats['sources_used'].append(source)
 
         stats['end_time'] = datetime.now()
         stats['duration_minutes'] = (stats['end_time'] - stats['start_time']).seconds / 60
@@ -326,14 +388,45 @@ class GenZJobSearcher:
             'start_time': datetime.now()
         }
 
-        for profile_name in self.SEARCH_PROFILES.keys():
-            profile_stats = self.run_search_profile(profile_name, max_keywords=max_keywords_per_profile)
-
-            if profile_stats:
-                all_stats['total_profiles'] += 1
-                all_stats['total_new_jobs'] += profile_stats['new_jobs_added']
-                all_stats['total_jobs_found'] += profile_stats['total_jobs_found']
-                all_stats['profile_results'].append(profile_stats)
+        # Profiles overlap heavily (e.g. 'data analyst' terms), so search each
+        # (source, keyword) pair once and credit the result to every profile
+        # that asked for it, instead of paying the rate-limit delay per profile
+        profile_stats = {}
+        profiles_by_source = defaultdict(dict)  # source -> {keyword: [profiles]}
+        for profile_name, profile in self.SEARCH_PROFILES.items():
+            keywords = profile['keywords'][:max_keywords_per_profile] if max_keywords_per_profile else profile['keywords']
+            profile_stats[profile_name] = {
+                'profile': profile_name,
+                'keywords_searched': len(keywords),
+                'total_jobs_found': 0,
+                'new_jobs_added': 0,
+                'sources_used': [],
+                'start_time': all_stats['start_time']
+            }
+            for source in self.sources_for_profile(profile_name):
+                for keyword in keywords:
+                    profiles_by_source[source].setdefault(keyword, []).append(profile_name)
+
+        for source, keyword_profiles in profiles_by_source.items():
+            logger.info(f"Searching {source} for {len(keyword_profiles)} unique keywords")
+
+            for keyword, profile_names in keyword_profiles.items():
+                new, total = self.search_with_rate_limit(source, keyword)
+                all_stats['total_new_jobs'] += new
+                all_stats['total_jobs_found'] += total
+
+                for profile_name in profile_names:
+                    stats = profile_stats[profile_name]
+                    stats['new_jobs_added'] += new
+                    stats['total_jobs_found'] += total
+                    if source not in stats['sources_used']:
+                        stats['sources_used'].append(source)
+
+        for stats in profile_stats.values():
+            stats['end_time'] = datetime.now()
+            stats['duration_minutes'] = (stats['end_time'] - stats['start_time']).seconds / 60
+            all_stats['total_profiles'] += 1
+            all_stats['profile_results'].append(stats)
 
         all_stats['end_time'] = datetime.now()
         all_stats['duration_hours'] = (all_stats['end_time'] - all_stats['start_time']).seconds / 3600
@@ -413,13 +506,22 @@ def run_scheduler():
     logger.info(f"Profiles: {len(GenZJobSearcher.SEARCH_PROFILES)}")
 
     searcher = GenZJobSearcher()
-    setup_schedule(searcher)
-
-    logger.info("Scheduler running. Press Ctrl+C to stop.")
-
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    try:
+        setup_schedule(searcher)
+
+        logger.info("Scheduler running. Press Ctrl+C to stop.")
+
+        while True:
+            # Sleep until the next job is due instead of polling every minute
+            idle = schedule.idle_seconds()
+            if idle is None:
+                logger.info("No scheduled jobs left, stopping scheduler")
+                break
+            if idle > 0:
+                time.sleep(idle)
+            schedule.run_pending()
+    finally:
+        searcher.close()
 
 
 if __name__ == "__main__":
@@ -1,29 +1,208 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession, DEFAULT_IGNORED_PARAMS
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+import lxml.html
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
-import json
+from email.utils import parsedate_to_datetime
+from html import unescape
+import orjson
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import re
 
 
+_AGO_RE = re.compile(r'\d+')
+_WWR_BASE_URL = "https://weworkremotely.com"
+
+# Only build the parts of the page we read; nav, scripts and footers are skipped
+_WWR_STRAINER = SoupStrainer('li', class_='feature')
+_CRUNCHBOARD_STRAINER = SoupStrainer('div', class_='job-card')
+
+# One pooled session shared by all scrapers so keep-alive connections are reused.
+# Responses are cached for 10 minutes and revalidated with ETag/Last-Modified,
+# so unchanged feeds come back as 304s on frequent scheduled runs.
+# Adzuna's app_id/app_key query params are redacted so they never hit the cache file.
+_SESSION = CachedSession(
+    'scrapers_http_cache',
+    backend='sqlite',
+    expire_after=600,
+    cache_control=True,
+    stale_if_error=True,
+    ignored_parameters=[*DEFAULT_IGNORED_PARAMS, 'app_id', 'app_key']
+)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+
+_PARSERS = threading.local()
+
+# Lenient, locked-down parser for remote RSS: recovers from stray '&' or markup
+# like BeautifulSoup's 'xml' builder did, and never expands entities or fetches DTDs
+_RSS_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+
+def _html_parser():
+    """
+    Reusable lxml HTML parser, one per thread
+
+    Skips building the ID index (unused here). Kept per thread so scrapers
+    running concurrently don't contend on a single parser.
+    """
+    parser = getattr(_PARSERS, 'html', None)
+    if parser is None:
+        parser = _PARSERS.html = lxml.html.HTMLParser(recover=True, collect_ids=False)
+    return parser
+
+
+def _find_all(elem, tag, cls):
+    """lxml equivalent of BeautifulSoup's find_all(tag, class_=cls)"""
+    return elem.xpath(f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]")
+
+
+def _find(elem, tag, cls):
+    """lxml equivalent of BeautifulSoup's find(tag, class_=cls)"""
+    found = _find_all(elem, tag, cls)
+    return found[0] if found else None
+
+
+def _text(elem):
+    """lxml equivalent of BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in elem.itertext())
+
+
+def _matches_keyword(kw, *fields, tags=None):
+    """
+    Check a lowercased keyword against a job's text fields and tags
+
+    No keyword matches everything. Missing fields are skipped and tags are
+    coerced to str, so one odd value can't abort a whole feed.
+    """
+    if not kw:
+        return True
+    haystack = ' '.join([*(field or '' for field in fields), *map(str, tags or ())])
+    return kw in haystack.lower()
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `calls` requests per `period` seconds"""
+
+    def __init__(self, calls, period):
+        self.capacity = calls
+        self.tokens = float(calls)
+        self.fill_rate = calls / period
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request may be sent"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            # Reserve a token; a negative balance is the wait owed by this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.fill_rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+@dataclass(slots=True)
+class ScrapedJob(Mapping):
+    """
+    One scraped job posting
+
+    Slots keep thousands of in-flight jobs compact. It is also a read-only
+    Mapping, so callers can keep using job['title'], job.get(...) and
+    **job exactly as with the plain dicts scrapers used to return.
+    """
+    title: str
+    company: str
+    location: str
+    description: str
+    url: str
+    source: str
+    posted_date: datetime
+    job_type: str
+    salary: Optional[str]
+    tags: list
+    remote: bool
+
+    def __getitem__(self, key):
+        if key not in _SCRAPED_JOB_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(_SCRAPED_JOB_FIELDS)
+
+    def __len__(self):
+        return len(_SCRAPED_JOB_FIELDS)
+
+
+_SCRAPED_JOB_FIELDS = tuple(f.name for f in fields(ScrapedJob))
+
+
 class BaseScraper(ABC):
     """Base class for all job scrapers"""
 
+    # Max requests in flight per scraper, keeps us under per-host rate limits
+    max_concurrency = 5
+    # (calls, period_seconds) cap on fetch_all requests, None = unlimited
+    rate_limit = None
+
     def __init__(self, timeout=30):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = _SESSION
+        self.rate_limiter = RateLimiter(*self.rate_limit) if self.rate_limit else None
 
     @abstractmethod
-    def scrape(self, keywords=None, location=None, max_pages=5) -> List[Dict]:
+    def scrape(self, keywords=None, location=None, max_pages=5) -> List[ScrapedJob]:
         """Scrape jobs from the source"""
         pass
 
+    def fetch_all(self, requests_list, parse=None):
+        """
+        Fetch independent pages concurrently
+
+        Args:
+            requests_list: List of (url, params) tuples
+            parse: Optional callable applied to each response in its worker
+                thread, so one page is parsed while others are still downloading
+
+        Returns:
+            List of responses (or parse results) in request order; a failed
+            request yields its exception
+        """
+        def fetch(request):
+            url, params = request
+            try:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                return parse(response) if parse else response
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(fetch, requests_list))
+
     def normalize_date(self, date_str):
         """Normalize various date formats to datetime"""
         if not date_str:
@@ -32,12 +211,24 @@ class BaseScraper(ABC):
         try:
             # Handle relative dates like "2 days ago"
             if 'ago' in str(date_str).lower():
-                numbers = re.findall(r'\d+', str(date_str))
-                if numbers:
-                    days = int(numbers[0])
+                match = _AGO_RE.search(str(date_str))
+                if match:
+                    days = int(match.group())
                     return datetime.utcnow() - timedelta(days=days)
 
-            # Try parsing standard formats
+            # ISO 8601 (Adzuna, Remotive, GitHub) - fast C parser
+            try:
+                return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+
+            # RFC 2822 (RSS pubDate)
+            try:
+                return parsedate_to_datetime(date_str)
+            except (TypeError, ValueError):
+                pass
+
+            # Fall back to dateutil for anything else
             return date_parser.parse(date_str)
         except:
             return datetime.utcnow()
@@ -46,6 +237,8 @@ class BaseScraper(ABC):
 class AdzunaScraper(BaseScraper):
     """Adzuna API - requires free API key"""
 
+    rate_limit = (25, 60)
+
     def __init__(self, app_id, app_key, timeout=30):
         super().__init__(timeout)
         self.app_id = app_id
@@ -56,37 +249,39 @@ class AdzunaScraper(BaseScraper):
         jobs = []
         country = "us"  # Can be parameterized
 
-        for page in range(1, max_pages + 1):
-            try:
-                url = f"{self.base_url}/{country}/search/{page}"
-                params = {
-                    'app_id': self.app_id,
-                    'app_key': self.app_key,
-                    'results_per_page': 50,
-                    'what': keywords or '',
-                    'where': location or ''
-                }
+        params = {
+            'app_id': self.app_id,
+            'app_key': self.app_key,
+            'results_per_page': 50,
+            'what': keywords or '',
+            'where': location or ''
+        }
+        pages = [(f"{self.base_url}/{country}/search/{page}", params) for page in range(1, max_pages + 1)]
 
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                response.raise_for_status()
-                data = response.json()
+        for page, response in enumerate(self.fetch_all(pages), 1):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                data = orjson.loads(response.content)
 
                 for job in data.get('results', []):
-                    jobs.append({
-                        'title': job.get('title', 'N/A'),
-                        'company': job.get('company', {}).get('display_name', 'N/A'),
-                        'location': job.get('location', {}).get('display_name', 'N/A'),
-                        'description': job.get('description', ''),
-                        'url': job.get('redirect_url', ''),
-                        'source': 'adzuna',
-                        'posted_date': self.normalize_date(job.get('created')),
-                        'job_type': job.get('contract_time', 'N/A'),
-                        'salary': f"${job.get('salary_min', 0)}-${job.get('salary_max', 0)}" if job.get('salary_min') else None,
-                        'tags': json.dumps(job.get('category', {}).get('tag', '')),
-                        'remote': 'remote' in job.get('location', {}).get('display_name', '').lower()
-                    })
-
-                time.sleep(1)  # Rate limiting
+                    location_name = (job.get('location') or {}).get('display_name', 'N/A')
+                    category_tag = (job.get('category') or {}).get('tag')
+                    salary_min = job.get('salary_min')
+
+                    jobs.append(ScrapedJob(
+                        title=job.get('title', 'N/A'),
+                        company=(job.get('company') or {}).get('display_name', 'N/A'),
+                        location=location_name,
+                        description=job.get('description', ''),
+                        url=job.get('redirect_url', ''),
+                        source='adzuna',
+                        posted_date=self.normalize_date(job.get('created')),
+                        job_type=job.get('contract_time', 'N/A'),
+                        salary=f"${salary_min}-${job.get('salary_max', 0)}" if salary_min else None,
+                        tags=[category_tag] if category_tag else [],
+                        remote='remote' in location_name.lower()
+                    ))
             except Exception as e:
                 print(f"Error scraping Adzuna page {page}: {e}")
                 break
@@ -101,13 +296,19 @@ class RemoteOKScraper(BaseScraper):
         jobs = []
         try:
             url = "https://remoteok.com/api"
+            # Read the whole body rather than stream=True: the feed is the same for
+            # every keyword, so repeat searches are served from the HTTP cache, and
+            # a cached response has no raw stream left to parse
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
 
             # First item is metadata, skip it
-            for job in data[1:]:
-                if keywords and keywords.lower() not in json.dumps(job).lower():
+            data = orjson.loads(response.content)[1:]
+
+            kw = keywords.lower() if keywords else None
+
+            for job in data:
+                if not _matches_keyword(kw, job.get('position'), job.get('description'), tags=job.get('tags')):
                     continue
 
                 # Parse date safely
@@ -122,19 +323,19 @@ class RemoteOKScraper(BaseScraper):
                 except:
                     posted_date = datetime.utcnow()
 
-                jobs.append({
-                    'title': job.get('position', 'N/A'),
-                    'company': job.get('company', 'N/A'),
-                    'location': job.get('location', 'Remote'),
-                    'description': job.get('description', ''),
-                    'url': f"https://remoteok.com/remote-jobs/{job.get('id', '')}",
-                    'source': 'remoteok',
-                    'posted_date': posted_date,
-                    'job_type': 'Full-time',
-                    'salary': None,
-                    'tags': json.dumps(job.get('tags', [])),
-                    'remote': True
-                })
+                jobs.append(ScrapedJob(
+                    title=job.get('position', 'N/A'),
+                    company=job.get('company', 'N/A'),
+                    location=job.get('location', 'Remote'),
+                    description=job.get('description', ''),
+                    url=f"https://remoteok.com/remote-jobs/{job.get('id', '')}",
+                    source='remoteok',
+                    posted_date=posted_date,
+                    job_type='Full-time',
+                    salary=None,
+                    tags=job.get('tags') or [],
+                    remote=True
+                ))
         except Exception as e:
             print(f"Error scraping RemoteOK: {e}")
 
@@ -144,23 +345,30 @@ class RemoteOKScraper(BaseScraper):
 class WeWorkRemotelyScraper(BaseScraper):
     """We Work Remotely - scrapes public listings"""
 
+    rate_limit = (30, 60)
+
     def scrape(self, keywords=None, location=None, max_pages=5):
         jobs = []
+        kw = keywords.lower() if keywords else None
         categories = ['programming', 'design', 'marketing', 'product', 'customer-support']
+        responses = self.fetch_all([
+            (f"{_WWR_BASE_URL}/categories/remote-{category}-jobs", None)
+            for category in categories
+        ])
 
-        for category in categories:
+        for category, response in zip(categories, responses):
             try:
-                url = f"https://weworkremotely.com/categories/remote-{category}-jobs"
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                if isinstance(response, Exception):
+                    raise response
                 # Use lxml parser to avoid XML warning
-                soup = BeautifulSoup(response.text, 'lxml')
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_WWR_STRAINER)
 
-                for job_elem in soup.find_all('li', class_='feature'):
+                # Fields stay grouped per listing so a missing span can't shift rows
+                for job_elem in soup.select('li.feature'):
                     try:
-                        title_elem = job_elem.find('span', class_='title')
-                        company_elem = job_elem.find('span', class_='company')
-                        link_elem = job_elem.find('a')
+                        title_elem = job_elem.select_one('span.title')
+                        company_elem = job_elem.select_one('span.company')
+                        link_elem = job_elem.select_one('a[href]')
 
                         if not title_elem or not company_elem:
                             continue
@@ -168,26 +376,24 @@ class WeWorkRemotelyScraper(BaseScraper):
                         title = title_elem.text.strip()
                         company = company_elem.text.strip()
 
-                        if keywords and keywords.lower() not in title.lower():
+                        if kw and kw not in title.lower():
                             continue
 
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': 'Remote',
-                            'description': '',
-                            'url': f"https://weworkremotely.com{link_elem['href']}" if link_elem else '',
-                            'source': 'weworkremotely',
-                            'posted_date': datetime.utcnow(),
-                            'job_type': 'Full-time',
-                            'salary': None,
-                            'tags': json.dumps([category]),
-                            'remote': True
-                        })
+                        jobs.append(ScrapedJob(
+                            title=title,
+                            company=company,
+                            location='Remote',
+                            description='',
+                            url=f"{_WWR_BASE_URL}{link_elem['href']}" if link_elem else '',
+                            source='weworkremotely',
+                            posted_date=datetime.utcnow(),
+                            job_type='Full-time',
+                            salary=None,
+                            tags=[category],
+                            remote=True
+                        ))
                     except Exception as e:
                         continue
-
-                time.sleep(2)  # Be respectful
             except Exception as e:
                 print(f"Error scraping WeWorkRemotely {category}: {e}")
 
@@ -201,27 +407,30 @@ class RemotiveScraper(BaseScraper):
         jobs = []
         try:
             url = "https://remotive.com/api/remote-jobs"
+            # Whole body, not stream=True - see RemoteOKScraper
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content).get('jobs', [])
+
+            kw = keywords.lower() if keywords else None
 
-            for job in data.get('jobs', []):
-                if keywords and keywords.lower() not in json.dumps(job).lower():
+            for job in data:
+                if not _matches_keyword(kw, job.get('title'), job.get('description'), tags=job.get('tags')):
                     continue
 
-                jobs.append({
-                    'title': job.get('title', 'N/A'),
-                    'company': job.get('company_name', 'N/A'),
-                    'location': 'Remote',
-                    'description': job.get('description', ''),
-                    'url': job.get('url', ''),
-                    'source': 'remotive',
-                    'posted_date': self.normalize_date(job.get('publication_date')),
-                    'job_type': job.get('job_type', 'N/A'),
-                    'salary': job.get('salary', None),
-                    'tags': json.dumps([job.get('category', '')]),
-                    'remote': True
-                })
+                jobs.append(ScrapedJob(
+                    title=job.get('title', 'N/A'),
+                    company=job.get('company_name', 'N/A'),
+                    location='Remote',
+                    description=job.get('description', ''),
+                    url=job.get('url', ''),
+                    source='remotive',
+                    posted_date=self.normalize_date(job.get('publication_date')),
+                    job_type=job.get('job_type', 'N/A'),
+                    salary=job.get('salary', None),
+                    tags=[job.get('category', '')],
+                    remote=True
+                ))
         except Exception as e:
             print(f"Error scraping Remotive: {e}")
 
@@ -233,20 +442,21 @@ class AuthenticJobsScraper(BaseScraper):
 
     def scrape(self, keywords=None, location=None, max_pages=5):
         jobs = []
+        kw = keywords.lower() if keywords else None
         try:
             url = "https://authenticjobs.com/rss"
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'xml')
+            tree = etree.fromstring(response.content, parser=_RSS_PARSER)
 
-            for item in soup.find_all('item'):
+            for item in tree.xpath('//item'):
                 try:
-                    title = item.find('title').text if item.find('title') else 'N/A'
-                    description = item.find('description').text if item.find('description') else ''
-                    link = item.find('link').text if item.find('link') else ''
-                    pub_date = item.find('pubDate').text if item.find('pubDate') else None
+                    title = item.findtext('title', 'N/A')
+                    description = item.findtext('description', '')
+                    link = item.findtext('link', '')
+                    pub_date = item.findtext('pubDate')
 
-                    if keywords and keywords.lower() not in title.lower():
+                    if kw and kw not in title.lower():
                         continue
 
                     # Parse company from title (usually format: "Job Title at Company")
@@ -256,19 +466,19 @@ class AuthenticJobsScraper(BaseScraper):
                         title = parts[0].strip()
                         company = parts[1].strip()
 
-                    jobs.append({
-                        'title': title,
-                        'company': company,
-                        'location': 'N/A',
-                        'description': description,
-                        'url': link,
-                        'source': 'authenticjobs',
-                        'posted_date': self.normalize_date(pub_date),
-                        'job_type': 'N/A',
-                        'salary': None,
-                        'tags': json.dumps([]),
-                        'remote': False
-                    })
+                    jobs.append(ScrapedJob(
+                        title=title,
+                        company=company,
+                        location='N/A',
+                        description=description,
+                        url=link,
+                        source='authenticjobs',
+                        posted_date=self.normalize_date(pub_date),
+                        job_type='N/A',
+                        salary=None,
+                        tags=[],
+                        remote=False
+                    ))
                 except Exception as e:
                     continue
         except Exception as e:
@@ -283,8 +493,8 @@ class GitHubJobsScraper(BaseScraper):
     def __init__(self, github_token=None, timeout=30):
         super().__init__(timeout)
         self.github_token = github_token
-        if github_token:
-            self.session.headers.update({'Authorization': f'token {github_token}'})
+        # Sent per request; the session is shared with other scrapers
+        self.headers = {'Authorization': f'token {github_token}'} if github_token else {}
 
     def scrape(self, keywords=None, location=None, max_pages=5):
         jobs = []
@@ -299,35 +509,163 @@ class GitHubJobsScraper(BaseScraper):
                 'per_page': 30
             }
 
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for repo in data.get('items', [])[:50]:
                 # Check if repo is actually a job posting
                 if any(word in repo.get('description', '').lower() for word in ['hiring', 'job', 'career', 'position']):
-                    jobs.append({
-                        'title': repo.get('name', 'N/A').replace('-', ' ').title(),
-                        'company': repo.get('owner', {}).get('login', 'N/A'),
-                        'location': 'Remote',
-                        'description': repo.get('description', ''),
-                        'url': repo.get('html_url', ''),
-                        'source': 'github',
-                        'posted_date': self.normalize_date(repo.get('created_at')),
-                        'job_type': 'N/A',
-                        'salary': None,
-                        'tags': json.dumps(repo.get('topics', [])),
-                        'remote': True
-                    })
+                    jobs.append(ScrapedJob(
+                        title=repo.get('name', 'N/A').replace('-', ' ').title(),
+                        company=repo.get('owner', {}).get('login', 'N/A'),
+                        location='Remote',
+                        description=repo.get('description', ''),
+                        url=repo.get('html_url', ''),
+                        source='github',
+                        posted_date=self.normalize_date(repo.get('created_at')),
+                        job_type='N/A',
+                        salary=None,
+                        tags=repo.get('topics', []),
+                        remote=True
+                    ))
         except Exception as e:
             print(f"Error scraping GitHub: {e}")
 
         return jobs
 
 
+_INDEED_JOBCARDS_RE = re.compile(
+    rb'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*(\{.*?\});',
+    re.DOTALL
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _indeed_job(title, company, job_location, description, job_url, salary):
+    """Build a job for one Indeed card, or None if key fields are missing"""
+    if not (title and company and job_url):
+        return None
+    return ScrapedJob(
+        title=title,
+        company=company,
+        location=job_location,
+        description=description,
+        url=job_url,
+        source='indeed',
+        posted_date=datetime.utcnow(),  # Indeed doesn't always show exact dates
+        job_type='N/A',
+        salary=salary,
+        tags=[],
+        remote='remote' in job_location.lower()
+    )
+
+
+def _parse_indeed_page(body, default_location):
+    """
+    Extract jobs from one Indeed results page
+
+    Indeed embeds all job cards as JSON in a <script> tag, which is much
+    cheaper to read than the DOM. Falls back to DOM parsing without it.
+    """
+    match = _INDEED_JOBCARDS_RE.search(body)
+    if match:
+        try:
+            data = orjson.loads(match.group(1))
+            results = data['metaData']['mosaicProviderJobCardsModel']['results']
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            results = None
+
+        if results is not None:
+            jobs = []
+            for card in results:
+                company = card.get('company')
+                if isinstance(company, dict):
+                    company = company.get('name')
+                job_key = card.get('jobkey')
+                job = _indeed_job(
+                    title=card.get('title'),
+                    company=company or 'N/A',
+                    job_location=card.get('formattedLocation') or card.get('jobLocationCity') or default_location,
+                    description=unescape(_TAG_RE.sub('', card.get('snippet') or '')).strip(),
+                    job_url=f"https://www.indeed.com/viewjob?jk={job_key}" if job_key else '',
+                    salary=(card.get('salarySnippet') or {}).get('text') or None
+                )
+                if job:
+                    jobs.append(job)
+            return jobs
+
+    return _parse_indeed_html(body, default_location)
+
+
+def _parse_indeed_html(body, default_location):
+    """Extract jobs from an Indeed results page by walking the job card DOM"""
+    jobs = []
+    tree = lxml.html.fromstring(body, parser=_html_parser())
+
+    # Find job cards - Indeed uses various class names
+    job_cards = _find_all(tree, 'div', 'job_seen_beacon')
+
+    if not job_cards:
+        # Try alternative selectors
+        job_cards = _find_all(tree, 'a', 'jcs-JobTitle')
+
+    for card in job_cards:
+        try:
+            # Extract job title
+            title_elem = _find(card, 'h2', 'jobTitle')
+            if title_elem is None:
+                title_elem = _find(card, 'a', 'jcs-JobTitle')
+            if title_elem is None:
+                continue
+
+            # Get the actual title text (skip the span with 'new' badge)
+            title_span = title_elem.xpath('.//span[@title]')
+            if title_span:
+                title = title_span[0].get('title')
+            else:
+                title = _text(title_elem)
+
+            # Extract company name
+            company_elem = _find(card, 'span', 'companyName')
+            company = _text(company_elem) if company_elem is not None else 'N/A'
+
+            # Extract location
+            location_elem = _find(card, 'div', 'companyLocation')
+            job_location = _text(location_elem) if location_elem is not None else default_location
+
+            # Extract job link
+            if title_elem.tag == 'a':
+                link_elem = title_elem
+            else:
+                links = title_elem.xpath('.//a')
+                link_elem = links[0] if links else None
+            job_id = link_elem.get('data-jk', '') if link_elem is not None else ''
+            job_url = f"https://www.indeed.com/viewjob?jk={job_id}" if job_id else ''
+
+            # Extract snippet/description
+            snippet_elem = _find(card, 'div', 'job-snippet')
+            description = _text(snippet_elem) if snippet_elem is not None else ''
+
+            # Extract salary if available
+            salary_elem = _find(card, 'div', 'salary-snippet')
+            salary = _text(salary_elem) if salary_elem is not None else None
+
+            job = _indeed_job(title, company, job_location, description, job_url, salary)
+            if job:
+                jobs.append(job)
+
+        except Exception as e:
+            continue
+
+    return jobs
+
+
 class IndeedScraper(BaseScraper):
     """Indeed - scrapes public job search results"""
 
+    rate_limit = (30, 60)
+
     def scrape(self, keywords=None, location=None, max_pages=5):
         jobs = []
 
@@ -337,88 +675,28 @@ class IndeedScraper(BaseScraper):
         if not location:
             location = "Remote"
 
-        try:
-            for page in range(max_pages):
-                # Indeed uses start parameter (0, 10, 20, etc.)
-                start = page * 10
-
-                url = "https://www.indeed.com/jobs"
-                params = {
-                    'q': keywords,
-                    'l': location,
-                    'start': start,
-                    'sort': 'date'  # Sort by date to get recent jobs
-                }
+        # Indeed uses start parameter (0, 10, 20, etc.)
+        pages = [
+            ("https://www.indeed.com/jobs", {
+                'q': keywords,
+                'l': location,
+                'start': page * 10,
+                'sort': 'date'  # Sort by date to get recent jobs
+            })
+            for page in range(max_pages)
+        ]
 
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'lxml')
-
-                # Find job cards - Indeed uses various class names
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
-
-                if not job_cards:
-                    # Try alternative selectors
-                    job_cards = soup.find_all('a', class_='jcs-JobTitle')
-
-                for card in job_cards:
-                    try:
-                        # Extract job title
-                        title_elem = card.find('h2', class_='jobTitle') or card.find('a', class_='jcs-JobTitle')
-                        if not title_elem:
-                            continue
-
-                        # Get the actual title text (skip the span with 'new' badge)
-                        title_span = title_elem.find('span', title=True)
-                        if title_span:
-                            title = title_span.get('title', title_elem.get_text(strip=True))
-                        else:
-                            title = title_elem.get_text(strip=True)
-
-                        # Extract company name
-                        company_elem = card.find('span', class_='companyName')
-                        company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-
-                        # Extract location
-                        location_elem = card.find('div', class_='companyLocation')
-                        job_location = location_elem.get_text(strip=True) if location_elem else location
-
-                        # Extract job link
-                        link_elem = title_elem if title_elem.name == 'a' else title_elem.find('a')
-                        job_id = link_elem.get('data-jk', '') if link_elem else ''
-                        job_url = f"https://www.indeed.com/viewjob?jk={job_id}" if job_id else ''
-
-                        # Extract snippet/description
-                        snippet_elem = card.find('div', class_='job-snippet')
-                        description = snippet_elem.get_text(strip=True) if snippet_elem else ''
-
-                        # Extract salary if available
-                        salary_elem = card.find('div', class_='salary-snippet')
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-
-                        if title and company and job_url:
-                            jobs.append({
-                                'title': title,
-                                'company': company,
-                                'location': job_location,
-                                'description': description,
-                                'url': job_url,
-                                'source': 'indeed',
-                                'posted_date': datetime.utcnow(),  # Indeed doesn't always show exact dates
-                                'job_type': 'N/A',
-                                'salary': salary,
-                                'tags': json.dumps([]),
-                                'remote': 'remote' in job_location.lower()
-                            })
-
-                    except Exception as e:
-                        continue
+        def parse(response):
+            return _parse_indeed_page(response.content, location)
 
-                # Be respectful with rate limiting
-                time.sleep(2)
+        try:
+            for page_jobs in self.fetch_all(pages, parse=parse):
+                if isinstance(page_jobs, Exception):
+                    raise page_jobs
+                jobs.extend(page_jobs)
 
                 # Stop if we didn't find any jobs
-                if not job_cards:
+                if not page_jobs:
                     break
 
         except Exception as e:
@@ -443,11 +721,12 @@ class CrunchboardScraper(BaseScraper):
 
     def scrape(self, keywords=None, location=None, max_pages=5):
         jobs = []
+        kw = keywords.lower() if keywords else None
         try:
             url = "https://www.crunchboard.com/jobs"
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_CRUNCHBOARD_STRAINER)
 
             # Parse job listings (structure may vary)
             job_cards = soup.find_all('div', class_='job-card')
@@ -464,22 +743,22 @@ class CrunchboardScraper(BaseScraper):
 
                     title = title_elem.text.strip()
 
-                    if keywords and keywords.lower() not in title.lower():
+                    if kw and kw not in title.lower():
                         continue
 
-                    jobs.append({
-                        'title': title,
-                        'company': company_elem.text.strip() if company_elem else 'N/A',
-                        'location': location_elem.text.strip() if location_elem else 'N/A',
-                        'description': '',
-                        'url': link_elem['href'] if link_elem and 'href' in link_elem.attrs else '',
-                        'source': 'crunchboard',
-                        'posted_date': datetime.utcnow(),
-                        'job_type': 'N/A',
-                        'salary': None,
-                        'tags': json.dumps([]),
-                        'remote': False
-                    })
+                    jobs.append(ScrapedJob(
+                        title=title,
+                        company=company_elem.text.strip() if company_elem else 'N/A',
+                        location=location_elem.text.strip() if location_elem else 'N/A',
+                        description='',
+                        url=link_elem['href'] if link_elem and 'href' in link_elem.attrs else '',
+                        source='crunchboard',
+                        posted_date=datetime.utcnow(),
+                        job_type='N/A',
+                        salary=None,
+                        tags=[],
+                        remote=False
+                    ))
                 except Exception as e:
                     continue
         except Exception as e:
@@ -4,7 +4,9 @@ This will help you figure out which Indeed API you need to subscribe to
 """
 
 import os
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -58,30 +60,60 @@ print("Testing each Indeed API on RapidAPI...\n")
 working_apis = []
 subscription_needed = []
 
-for i, api in enumerate(indeed_apis, 1):
-    print(f"{i}. Testing: {api['name']}")
-    print(f"   Host: {api['host']}")
+# Reuse one connection pool across probes
+session = requests.Session()
+
+PREVIEW_BYTES = 4096
+
 
+def probe(api):
+    """
+    Call one API, returning (response, first 4KB of body) or the exception raised
+
+    Only the start of the body is read - enough to classify the endpoint
+    without downloading a full job list.
+    """
     headers = {
         'X-RapidAPI-Key': api_key,
         'X-RapidAPI-Host': api['host']
     }
+    try:
+        with session.get(api['url'], headers=headers, params=api['params'], stream=True, timeout=10) as response:
+            chunk = next(response.iter_content(PREVIEW_BYTES), b'')
+        return response, chunk
+    except Exception as e:
+        return e
+
+
+# Probes hit different hosts, so run them all at once; map() keeps the order
+with ThreadPoolExecutor(max_workers=len(indeed_apis)) as executor:
+    responses = list(executor.map(probe, indeed_apis))
+
+for i, (api, result) in enumerate(zip(indeed_apis, responses), 1):
+    print(f"{i}. Testing: {api['name']}")
+    print(f"   Host: {api['host']}")
 
     try:
-        response = requests.get(api['url'], headers=headers, params=api['params'], timeout=10)
+        if isinstance(result, Exception):
+            raise result
+        response, chunk = result
+        preview = chunk[:100].decode('utf-8', 'ignore')
 
         if response.status_code == 200:
-            data = response.json()
-            jobs_found = 0
+            # Small bodies fit in the preview and can be parsed to count jobs
+            try:
+                data = orjson.loads(chunk)
+            except orjson.JSONDecodeError:
+                data = None
 
-            # Try to count jobs from response
             if isinstance(data, list):
-                jobs_found = len(data)
+                print(f"   Status: [OK] WORKS! Found {len(data)} jobs")
             elif isinstance(data, dict):
                 jobs_found = len(data.get('results', data.get('jobs', data.get('data', []))))
-
-            print(f"   Status: [OK] WORKS! Found {jobs_found} jobs")
-            print(f"   Response preview: {str(data)[:100]}...")
+                print(f"   Status: [OK] WORKS! Found {jobs_found} jobs")
+            else:
+                print(f"   Status: [OK] WORKS! (response larger than {PREVIEW_BYTES // 1024}KB preview)")
+            print(f"   Response preview: {preview}...")
             working_apis.append(api)
 
         elif response.status_code == 403:
@@ -95,7 +127,7 @@ for i, api in enumerate(indeed_apis, 1):
 
         else:
             print(f"   Status: [FAIL] Error {response.status_code}")
-            print(f"   Response: {response.text[:100]}")
+            print(f"   Response: {preview}")
 
     except Exception as e:
         print(f"   Status: [FAIL] Connection error: {e}")
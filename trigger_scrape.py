@@ -11,10 +11,12 @@ Usage:
     python trigger_scrape.py --url https://your-railway-app.up.railway.app
 """
 
-import requests
+import httpx
+import orjson
 import sys
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Fix Windows console encoding for emojis
@@ -26,6 +28,18 @@ if sys.platform == 'win32':
 
 load_dotenv()
 
+# One HTTP/2 client for every call to the API: over HTTPS, concurrent requests
+# (e.g. the parallel Gen-Z searches) are multiplexed on a single connection.
+# Only failed connects are retried, so a scrape or import is never sent twice.
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    ),
+    follow_redirects=True
+)
+
 def trigger_scrape(base_url, sources=None, keywords=None):
     """Trigger job scraping"""
     scrape_url = f"{base_url}/scrape"
@@ -43,10 +57,10 @@ def trigger_scrape(base_url, sources=None, keywords=None):
     print(f"   Payload: {payload}")
 
     try:
-        response = requests.post(scrape_url, json=payload, timeout=300)  # 5 min timeout
+        response = CLIENT.post(scrape_url, json=payload, timeout=300)  # 5 min timeout
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         print("\n✅ Scraping completed!")
         print(f"   Total scraped: {data['total_scraped']}")
         print(f"   New jobs: {data['total_new']}")
@@ -57,7 +71,7 @@ def trigger_scrape(base_url, sources=None, keywords=None):
 
         return True
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("⚠️  Request timed out. Jobs may still be scraping in background.")
         return True
     except Exception as e:
@@ -71,10 +85,10 @@ def import_jobs(base_url):
     print(f"\n📥 Importing jobs to job board database...")
 
     try:
-        response = requests.post(import_url, timeout=120)
+        response = CLIENT.post(import_url, timeout=120)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         print("✅ Import completed!")
         print(f"   Imported: {data['imported']} new jobs")
         print(f"   Skipped: {data['skipped']} duplicates")
@@ -93,10 +107,10 @@ def get_stats(base_url):
     print(f"\n📊 Fetching statistics...")
 
     try:
-        response = requests.get(stats_url, timeout=30)
+        response = CLIENT.get(stats_url, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         print("✅ Current statistics:")
         print(f"   Total jobs: {data.get('total_jobs', 0)}")
         print(f"   Remote jobs: {data.get('remote_jobs', 0)}")
@@ -121,9 +135,9 @@ def run_genz_search(base_url, profile=None):
     # Get available profiles
     profiles_url = f"{base_url}/genz/profiles"
     try:
-        response = requests.get(profiles_url, timeout=30)
+        response = CLIENT.get(profiles_url, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         profiles = data['profiles']
 
         print(f"   Available profiles: {', '.join(profiles)}")
@@ -138,20 +152,26 @@ def run_genz_search(base_url, profile=None):
             # Run a few key profiles
             profiles_to_run = ['entry_tech', 'mid_tech', 'entry_data']
 
-        for prof in profiles_to_run:
-            print(f"\n   Running {prof} search...")
-            search_url = f"{base_url}/genz/search/{prof}"
-            try:
-                response = requests.post(search_url, params={"max_keywords": 3}, timeout=180)
-                if response.status_code == 200:
-                    result = response.json()
-                    print(f"   ✅ {prof}: {result.get('message', 'Started')}")
-                else:
-                    print(f"   ⚠️  {prof}: Status {response.status_code}")
-            except Exception as e:
-                print(f"   ⚠️  {prof}: {e}")
-
-            time.sleep(2)  # Rate limiting
+        # Each profile search is an independent server-side job, so run them
+        # at once and report each as it finishes
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {}
+            for prof in profiles_to_run:
+                print(f"\n   Running {prof} search...")
+                search_url = f"{base_url}/genz/search/{prof}"
+                futures[executor.submit(CLIENT.post, search_url, params={"max_keywords": 3}, timeout=180)] = prof
+
+            for future in as_completed(futures):
+                prof = futures[future]
+                try:
+                    response = future.result()
+                    if response.status_code == 200:
+                        result = orjson.loads(response.content)
+                        print(f"   ✅ {prof}: {result.get('message', 'Started')}")
+                    else:
+                        print(f"   ⚠️  {prof}: Status {response.status_code}")
+                except Exception as e:
+                    print(f"   ⚠️  {prof}: {e}")
 
         return True
 
@@ -188,7 +208,7 @@ def main():
     # Check if API is reachable
     try:
         health_url = f"{base_url}/health"
-        response = requests.get(health_url, timeout=10)
+        response = CLIENT.get(health_url, timeout=10)
         if response.status_code == 200:
             print("✅ API is reachable and healthy")
         else:
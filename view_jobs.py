@@ -5,50 +5,68 @@ Shows complete job information including URLs and descriptions
 """
 
 import argparse
+import sys
 from aggregator import JobAggregator
 
+DATE_FORMAT = '%Y-%m-%d'
+
 
 def view_jobs(keyword=None, source=None, remote_only=False, limit=10, show_full=False):
     """View job details"""
     aggregator = JobAggregator()
 
-    jobs = aggregator.search_jobs(
+    # Stream rows so only a small batch of Job objects is alive at a time
+    jobs = aggregator.search_jobs_iter(
         keyword=keyword,
         source=source,
         remote=remote_only if remote_only else None,
         limit=limit
     )
 
-    if not jobs:
+    # Build the whole listing and write it once instead of a print() per line
+    parts = []
+    append = parts.append  # bound once, called several times per job
+    count = 0
+
+    for i, job in enumerate(jobs, 1):
+        count = i
+        posted_date = job.posted_date
+        append(
+            f"{i}. {job.title}\n"
+            f"   Company: {job.company}\n"
+            f"   Location: {job.location}\n"
+            f"   Source: {job.source}\n"
+            f"   Remote: {'Yes' if job.remote else 'No'}\n"
+            f"   Posted: {posted_date.strftime(DATE_FORMAT) if posted_date else 'Unknown'}\n"
+        )
+
+        salary = job.salary
+        if salary:
+            append(f"   Salary: {salary}\n")
+
+        job_type = job.job_type
+        if job_type:
+            append(f"   Type: {job_type}\n")
+
+        append(f"   URL: {job.url}\n")
+
+        description = job.description
+        if show_full and description:
+            # Slicing past the end is a no-op, so only the suffix needs the length check
+            desc = description[:300]
+            if len(description) > 300:
+                desc += '...'
+            append(f"   Description: {desc}\n")
+
+        append("\n")
+
+    if not count:
         print("No jobs found matching your criteria")
         aggregator.close()
         return
 
-    print(f"\n{'='*80}")
-    print(f"Found {len(jobs)} jobs")
-    print(f"{'='*80}\n")
-
-    for i, job in enumerate(jobs, 1):
-        print(f"{i}. {job.title}")
-        print(f"   Company: {job.company}")
-        print(f"   Location: {job.location}")
-        print(f"   Source: {job.source}")
-        print(f"   Remote: {'Yes' if job.remote else 'No'}")
-        print(f"   Posted: {job.posted_date.strftime('%Y-%m-%d') if job.posted_date else 'Unknown'}")
-
-        if job.salary:
-            print(f"   Salary: {job.salary}")
-
-        if job.job_type:
-            print(f"   Type: {job.job_type}")
-
-        print(f"   URL: {job.url}")
-
-        if show_full and job.description:
-            desc = job.description[:300] + '...' if len(job.description) > 300 else job.description
-            print(f"   Description: {desc}")
-
-        print()
+    header = f"\n{'='*80}\nFound {count} jobs\n{'='*80}\n\n"
+    sys.stdout.write(header + "".join(parts))
 
     aggregator.close()
 